@@ -10,31 +10,26 @@ import os
 import sys
 import logging
 import argparse
-import subprocess
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Ajouter le répertoire parent au chemin Python
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Configuration du logging
-os.makedirs('logs', exist_ok=True)
-log_file = f"logs/pipeline_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
+from src.utils import configure_logging
+
+# Configuration du logging (commune aux modules importés par le pipeline)
+configure_logging('pipeline_execution')
 logger = logging.getLogger(__name__)
 
 # Charger les variables d'environnement
 load_dotenv()
 
+@functools.lru_cache(maxsize=1)
 def parse_arguments():
-    """Parse les arguments de ligne de commande."""
+    """Parse les arguments de ligne de commande (une seule fois par exécution)."""
     parser = argparse.ArgumentParser(description='Pipeline de collecte et analyse d\'offres d\'emploi')
     parser.add_argument('--action', choices=['scrape', 'etl', 'analyze', 'all'], default='all',
                         help='Action à exécuter (scrape, etl, analyze, all)')
@@ -42,8 +37,15 @@ def parse_arguments():
                         help='Source des données (welcome_jungle, pole_emploi, all)')
     parser.add_argument('--terms', type=str, help='Termes de recherche séparés par des virgules')
     parser.add_argument('--pages', type=int, default=3, help='Nombre maximum de pages à scraper par terme')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1,
+                        help='Nombre maximum de termes scrapés en parallèle')
     parser.add_argument('--no-s3', action='store_true', help='Ne pas utiliser S3')
     parser.add_argument('--no-rds', action='store_true', help='Ne pas utiliser RDS')
+    parser.add_argument('--force', action='store_true',
+                        help='Recharger les données depuis RDS et régénérer le rapport sans utiliser le cache local '
+                             '(utile juste après un rechargement de la base)')
+    parser.add_argument('--skip-aws-check', action='store_true',
+                        help='Ne pas vérifier la configuration AWS avant de démarrer')
     return parser.parse_args()
 
 def check_aws_configuration():
@@ -54,20 +56,34 @@ def check_aws_configuration():
     print("\nVérification de la configuration AWS avant de démarrer le pipeline...\n")
     
     try:
-        # Exécuter le script de vérification AWS en mode direct (pas de capture)
-        # pour permettre l'affichage en temps réel
+        # Exécuter le script de vérification AWS dans le processus courant
+        # (évite le démarrage d'un nouvel interpréteur et la réimportation de boto3)
         aws_check_script = os.path.join('scripts', 'verify_aws.py')
         
-        if not os.path.exists(aws_check_script):
-            logger.error(f"Script de vérification AWS non trouvé: {aws_check_script}")
-            print(f"❌ Script de vérification AWS non trouvé: {aws_check_script}")
-            return False
-        
-        logger.info(f"Exécution du script de vérification AWS: {aws_check_script}")
-        result = subprocess.run([sys.executable, aws_check_script])
+        # Le script recharge .env avec override=True : l'environnement du pipeline
+        # (variables DB_* passées en ligne de commande...) est restauré après la vérification
+        saved_environ = dict(os.environ)
+        try:
+            try:
+                from scripts import verify_aws
+            except ImportError as e:
+                if e.name in ('scripts', 'scripts.verify_aws'):
+                    logger.error(f"Script de vérification AWS non trouvé: {aws_check_script} ({e})")
+                    print(f"❌ Script de vérification AWS non trouvé: {aws_check_script}")
+                else:
+                    # Dépendance du script absente (boto3, psycopg2...)
+                    logger.error(f"Impossible de charger le script de vérification AWS {aws_check_script}: {e}")
+                    print(f"❌ Impossible de charger le script de vérification AWS: {e}")
+                return False
+            
+            logger.info(f"Exécution du script de vérification AWS: {aws_check_script}")
+            returncode = verify_aws.main()
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_environ)
         
-        if result.returncode != 0:
-            logger.error(f"La vérification AWS a échoué avec le code de sortie {result.returncode}")
+        if returncode != 0:
+            logger.error(f"La vérification AWS a échoué avec le code de sortie {returncode}")
             print("\n❌ La configuration AWS n'est pas correcte. Veuillez corriger les erreurs avant de continuer.")
             return False
         
@@ -80,6 +96,24 @@ def check_aws_configuration():
         print(f"\n❌ Erreur lors de la vérification AWS: {e}")
         return False
 
+def scrape_term(term, max_pages):
+    """
+    Scrape les offres d'un terme de recherche avec son propre scraper.
+    
+    Chaque terme utilise une instance dédiée afin que les sessions de
+    navigation ne soient pas partagées entre les threads.
+    
+    Args:
+        term (str): Terme de recherche
+        max_pages (int): Nombre maximum de pages à scraper
+    
+    Returns:
+        list: Offres trouvées pour le terme
+    """
+    from src.data_collection.scrapers.welcome_jungle_improved import WelcomeToTheJungleScraper
+    scraper = WelcomeToTheJungleScraper()
+    return scraper.scrape_jobs(term, max_pages=max_pages)
+
 def main():
     """Fonction principale du pipeline."""
     # Créer les dossiers nécessaires
@@ -93,11 +127,18 @@ def main():
     # Parser les arguments
     args = parse_arguments()
     
-    # Vérifier la configuration AWS avant de démarrer le pipeline
-    if not check_aws_configuration():
+    # Vérifier la configuration AWS avant de démarrer le pipeline,
+    # uniquement si les étapes demandées utilisent S3 ou RDS
+    needs_aws = not (args.no_s3 and args.no_rds) and args.action != 'analyze'
+    if args.skip_aws_check or not needs_aws:
+        logger.info("Vérification de la configuration AWS ignorée")
+    elif not check_aws_configuration():
         logger.error("La vérification de la configuration AWS a échoué. Arrêt du pipeline.")
         return 1
     
+    # Horodatage unique de l'exécution, partagé par les fichiers bruts et traités
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
     # Afficher les informations de configuration
     logger.info("Démarrage du pipeline de collecte et analyse d'offres d'emploi")
     logger.info(f"Action: {args.action}")
@@ -114,15 +155,30 @@ def main():
             from src.data_collection.scrapers.welcome_jungle_improved import WelcomeToTheJungleScraper
             scraper = WelcomeToTheJungleScraper()
             
-            # Scraper les offres
+            # Scraper les offres (les termes sont indépendants, on les traite en parallèle)
             all_jobs = []
-            for term in search_terms:
-                logger.info(f"Scraping des offres pour le terme: {term}")
-                jobs = scraper.scrape_jobs(term, max_pages=args.pages)
-                logger.info(f"Nombre d'offres trouvées pour '{term}': {len(jobs)}")
-                all_jobs.extend(jobs)
+            failed_terms = []
+            max_workers = max(1, min(len(search_terms), args.max_workers))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for term in search_terms:
+                    logger.info(f"Scraping des offres pour le terme: {term}")
+                    futures[executor.submit(scrape_term, term, args.pages)] = term
+                
+                for future in as_completed(futures):
+                    term = futures[future]
+                    try:
+                        jobs = future.result()
+                    except Exception as e:
+                        logger.error(f"Erreur lors du scraping du terme '{term}': {e}")
+                        failed_terms.append(term)
+                        continue
+                    logger.info(f"Nombre d'offres trouvées pour '{term}': {len(jobs)}")
+                    all_jobs.extend(jobs)
             
             logger.info(f"Nombre total d'offres trouvées: {len(all_jobs)}")
+            if failed_terms:
+                logger.warning(f"Termes en échec: {failed_terms}")
             
             # Récupérer les détails de chaque offre
             job_details_list = []
@@ -132,8 +188,7 @@ def main():
                 job_details_list.append(job_details)
             
             # Sauvegarder les résultats
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"data/raw/welcome_jungle/welcome_jungle_{timestamp}.json"
+            output_file = f"data/raw/welcome_jungle/welcome_jungle_{run_timestamp}.json"
             scraper.save_jobs_to_json(job_details_list, output_file)
             
             # Uploader vers S3 si demandé
@@ -158,14 +213,13 @@ def main():
             jobs_df = transform_to_dataframe(jobs_data)
             
             # Sauvegarder en local
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            processed_file = f"data/processed/welcome_jungle/processed_jobs_{timestamp}.json"
+            processed_file = f"data/processed/welcome_jungle/processed_jobs_{run_timestamp}.json"
             save_to_local(jobs_df, processed_file)
             
             # Charger vers S3 si demandé
             if not args.no_s3:
                 bucket_name = os.getenv('data_lake_bucket', 'data-lake-brut')
-                s3_path = f"processed/welcome_jungle/processed_jobs_{timestamp}.json"
+                s3_path = f"processed/welcome_jungle/processed_jobs_{run_timestamp}.json"
                 load_to_s3(jobs_df, bucket_name, s3_path)
             
             # Charger dans RDS si demandé
@@ -183,7 +237,7 @@ def main():
         from src.analysis.job_analysis import generate_report
         
         # Générer le rapport d'analyse
-        generate_report()
+        generate_report(force=args.force)
     
     logger.info(" Pipeline terminé avec succès ! ")
     return 0
@@ -188,40 +188,6 @@ def collect_all_jobs(max_pages=100, delay=1.0, upload_s3=True, force_collect=Fal
     
     return total_offres, saved_files
 
-def parse_args():
-    """Parse les arguments de la ligne de commande"""
-    parser = argparse.ArgumentParser(
-        description="Collecte toutes les offres d'emploi disponibles depuis l'API France Travail"
-    )
-    
-    parser.add_argument(
-        "--max-pages",
-        type=int,
-        default=100,
-        help="Nombre maximum de pages à récupérer (défaut: 100)"
-    )
-    
-    parser.add_argument(
-        "--delay",
-        type=float,
-        default=1.0,
-        help="Délai en secondes entre les requêtes (défaut: 1.0)"
-    )
-    
-    parser.add_argument(
-        "--no-s3",
-        action="store_true",
-        help="Ne pas télécharger les fichiers vers S3"
-    )
-    
-    parser.add_argument(
-        "--force",
-        action="store_true",
-        help="Forcer la collecte même si des données ont déjà été collectées aujourd'hui"
-    )
-    
-    return parser.parse_args()
-
 def main():
     """Fonction principale"""
     start_time = datetime.now()
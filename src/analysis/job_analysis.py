@@ -9,15 +9,14 @@ Fournit des fonctions pour analyser les tendances et statistiques des offres d'e
 import os
 import json
 import logging
+import tempfile
+import functools
+import multiprocessing
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from dotenv import load_dotenv
-import boto3
-import psycopg2
-from wordcloud import WordCloud
 
 # Charger les variables d'environnement
 load_dotenv()
@@ -29,13 +28,136 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def load_jobs_from_rds():
+# Colonnes de la table jobs utilisées par les analyses
+ANALYSIS_COLUMNS = ['location', 'contract_type', 'source', 'scraped_at']
+
+# Colonnes conservées pour les analyses lorsque les offres viennent de fichiers JSON
+ANALYSIS_FRAME_COLUMNS = ANALYSIS_COLUMNS + ['skills']
+
+# Colonnes à faible cardinalité converties en catégories avant les analyses
+CATEGORICAL_COLUMNS = ['contract_type', 'source']
+
+# Nombre de lignes récupérées par aller-retour avec le curseur côté serveur
+RDS_FETCH_SIZE = 50000
+
+# Cache local des offres chargées depuis RDS
+CACHE_DIR = 'data/cache'
+CACHE_FILE = os.path.join(CACHE_DIR, 'jobs_analysis.parquet')
+CACHE_VERSION_FILE = CACHE_FILE + '.version'
+
+# Tables lues par l'analyse, dont les modifications invalident le cache
+VERSIONED_TABLES = ('jobs', 'job_skills', 'skills')
+
+# Requête peu coûteuse identifiant l'état des tables utilisées par l'analyse.
+# Les compteurs cumulés d'insertions, mises à jour et suppressions de
+# pg_stat_user_tables évoluent aussi lors des UPDATE (ON CONFLICT ... DO UPDATE),
+# que ni les nombres de lignes ni MAX(scraped_at) ne reflètent. Ces statistiques
+# étant publiées de façon asynchrone, une analyse lancée juste après un
+# rechargement peut nécessiter l'option --force.
+TABLE_VERSION_QUERY = f"""
+    SELECT COALESCE(MAX(scraped_at)::text, '') || ':' || COUNT(*)::text
+           || ':' || (SELECT COUNT(*) FROM job_skills)::text
+           || ':' || COALESCE((
+               SELECT string_agg(
+                   schemaname || '.' || relname || '=' || n_tup_ins || '/' || n_tup_upd || '/' || n_tup_del,
+                   ',' ORDER BY schemaname, relname
+               )
+               FROM pg_stat_user_tables
+               WHERE relname IN ({', '.join(f"'{table}'" for table in VERSIONED_TABLES)})
+           ), '')
+    FROM jobs
+"""
+
+# Rapport d'analyse et répertoire de ses graphiques
+REPORT_FILE = 'reports/job_analysis_report.json'
+FIGURES_DIR = 'reports/figures'
+
+# Graphiques produits par chaque analyse (un rapport n'est réutilisé que s'ils existent encore)
+ANALYSIS_FIGURES = {
+    'contract_types': ['contract_types.png'],
+    'skills': ['top_skills.png', 'skills_wordcloud.png'],
+    'locations': ['top_locations.png'],
+    'sources': ['sources_pie.png'],
+}
+
+# Résolution des graphiques exportés (surchargeable pour un archivage haute définition)
+FIGURE_DPI = int(os.getenv('PIPELINE_FIG_DPI', '100'))
+
+def select_analysis_columns(df):
+    """
+    Ne conserve que les colonnes utilisées par les analyses.
+    
+    Les colonnes volumineuses (descriptions, URL...) ne sont ainsi ni gardées
+    en mémoire ni sérialisées vers les processus d'analyse.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame contenant les offres d'emploi
+    
+    Returns:
+        pandas.DataFrame: DataFrame réduit aux colonnes présentes parmi ANALYSIS_FRAME_COLUMNS
+    """
+    return df[[col for col in ANALYSIS_FRAME_COLUMNS if col in df.columns]]
+
+def read_cached_jobs(version):
+    """
+    Lit les offres depuis le cache Parquet local si sa version correspond.
+    
+    Args:
+        version (str): Version attendue des données
+    
+    Returns:
+        pandas.DataFrame: Offres en cache, ou None si le cache est absent ou périmé
+    """
+    if not os.path.exists(CACHE_FILE) or not os.path.exists(CACHE_VERSION_FILE):
+        return None
+    
+    try:
+        with open(CACHE_VERSION_FILE, 'r', encoding='utf-8') as f:
+            if f.read() != version:
+                return None
+        # Types pandas par défaut : les analyses s'appuient sur des accesseurs .str
+        # (extract...) non supportés par les colonnes ArrowDtype
+        return pd.read_parquet(CACHE_FILE, engine='pyarrow')
+    except Exception as e:
+        logger.warning(f"Impossible de lire le cache {CACHE_FILE}: {e}")
+        return None
+
+def write_cached_jobs(df, version):
+    """
+    Sauvegarde les offres dans le cache Parquet local avec leur version.
+    
+    Args:
+        df (pandas.DataFrame): Offres à mettre en cache
+        version (str): Version des données
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(CACHE_FILE, engine='pyarrow', compression='zstd', index=False)
+        with open(CACHE_VERSION_FILE, 'w', encoding='utf-8') as f:
+            f.write(version)
+    except Exception as e:
+        logger.warning(f"Impossible d'écrire le cache {CACHE_FILE}: {e}")
+
+def load_jobs_from_rds(columns=None, force=False):
     """
     Charge les offres d'emploi depuis la base de données RDS.
     
+    Seules les colonnes demandées sont lues afin de ne pas transférer
+    les champs volumineux (description, url...) inutiles à l'analyse.
+    Si les tables n'ont pas changé depuis le dernier chargement, les offres
+    sont relues depuis le cache Parquet local.
+    
+    Args:
+        columns (list, optional): Colonnes de la table jobs à charger
+            (par défaut ANALYSIS_COLUMNS)
+        force (bool): Si True, ignore le cache et recharge depuis RDS
+    
     Returns:
         pandas.DataFrame: DataFrame contenant les offres d'emploi
+        (version des données dans df.attrs['data_version'])
     """
+    columns = columns or ANALYSIS_COLUMNS
+    
     try:
         # Récupérer les paramètres de connexion
         host = os.getenv('DB_HOST')
@@ -44,6 +166,8 @@ def load_jobs_from_rds():
         user = os.getenv('DB_USER')
         password = os.getenv('DB_PASSWORD')
         
+        import psycopg2
+        
         # Établir la connexion
         connection = psycopg2.connect(
             host=host,
@@ -53,23 +177,53 @@ def load_jobs_from_rds():
             password=password
         )
         
+        # Réutiliser le cache si les données n'ont pas changé
+        with connection.cursor() as cursor:
+            cursor.execute(TABLE_VERSION_QUERY)
+            version = f"{cursor.fetchone()[0]}|{','.join(columns)}"
+        
+        if not force:
+            df = read_cached_jobs(version)
+            if df is not None:
+                connection.close()
+                logger.info(f"Chargé {len(df)} offres d'emploi depuis le cache {CACHE_FILE}")
+                df.attrs['data_version'] = version
+                return df
+        
         # Requête SQL pour récupérer les offres avec leurs compétences
-        query = """
-            SELECT j.id, j.title, j.company, j.location, j.contract_type, j.source, 
-                   j.scraped_at, array_agg(s.name) as skills
+        # (id étant la clé primaire, le GROUP BY sur j.id suffit)
+        selected_columns = ''.join(f", j.{col}" for col in columns)
+        query = f"""
+            SELECT j.id{selected_columns}, array_agg(s.name) as skills
             FROM jobs j
             LEFT JOIN job_skills js ON j.id = js.job_id
             LEFT JOIN skills s ON js.skill_id = s.id
-            GROUP BY j.id, j.title, j.company, j.location, j.contract_type, j.source, j.scraped_at
+            GROUP BY j.id
         """
         
-        # Exécuter la requête et charger les résultats dans un DataFrame
-        df = pd.read_sql_query(query, connection)
+        # Exécuter la requête avec un curseur côté serveur et charger les
+        # résultats par lots pour ne pas matérialiser tout le résultat d'un coup
+        chunks = []
+        with connection.cursor(name='analysis_jobs_cursor') as cursor:
+            cursor.itersize = RDS_FETCH_SIZE
+            cursor.execute(query)
+            result_columns = None
+            while True:
+                rows = cursor.fetchmany(RDS_FETCH_SIZE)
+                if result_columns is None:
+                    result_columns = [desc[0] for desc in cursor.description]
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame(rows, columns=result_columns))
+        
+        df = pd.concat(chunks, ignore_index=True, copy=False) if chunks else pd.DataFrame(columns=result_columns)
         
         # Fermer la connexion
         connection.close()
         
         logger.info(f"Chargé {len(df)} offres d'emploi depuis RDS")
+        write_cached_jobs(df, version)
+        df.attrs['data_version'] = version
         return df
     
     except Exception as e:
@@ -100,6 +254,8 @@ def load_jobs_from_s3(bucket_name=None, prefix='processed/'):
         if not bucket_name:
             bucket_name = os.getenv('data_lake_bucket', 'data-lake-brut')
         
+        import boto3
+        
         # Créer le client S3
         s3_client = boto3.client(
             's3',
@@ -132,8 +288,9 @@ def load_jobs_from_s3(bucket_name=None, prefix='processed/'):
         content = response['Body'].read().decode('utf-8')
         jobs_data = json.loads(content)
         
-        # Convertir en DataFrame
-        df = pd.DataFrame(jobs_data)
+        # Convertir en DataFrame en ne gardant que les colonnes analysées
+        df = select_analysis_columns(pd.DataFrame(jobs_data))
+        del jobs_data
         
         logger.info(f"Chargé {len(df)} offres d'emploi depuis S3: s3://{bucket_name}/{latest_file}")
         return df
@@ -177,8 +334,9 @@ def load_jobs_from_local(directory='data/processed/'):
         with open(latest_file, 'r', encoding='utf-8') as f:
             jobs_data = json.load(f)
         
-        # Convertir en DataFrame
-        df = pd.DataFrame(jobs_data)
+        # Convertir en DataFrame en ne gardant que les colonnes analysées
+        df = select_analysis_columns(pd.DataFrame(jobs_data))
+        del jobs_data
         
         logger.info(f"Chargé {len(df)} offres d'emploi depuis {latest_file}")
         return df
@@ -187,6 +345,51 @@ def load_jobs_from_local(directory='data/processed/'):
         logger.error(f"Erreur lors du chargement des offres depuis les fichiers locaux: {e}")
         return pd.DataFrame()
 
+@functools.lru_cache(maxsize=1)
+def get_pyplot():
+    """
+    Retourne matplotlib.pyplot configuré avec le backend non interactif Agg.
+    
+    Les graphiques sont uniquement enregistrés sur disque : le backend Agg évite
+    la recherche d'un affichage graphique (X11, Tk) au premier import de pyplot.
+    La configuration n'est faite qu'au premier appel dans chaque processus.
+    
+    Returns:
+        module: Le module matplotlib.pyplot
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def save_bar_chart(counts, title, ylabel, filename, figsize=(12, 8)):
+    """
+    Enregistre un diagramme en barres horizontales à partir de comptages déjà triés.
+    
+    Args:
+        counts (pandas.Series): Nombre d'offres par catégorie, dans l'ordre d'affichage
+        title (str): Titre du graphique
+        ylabel (str): Libellé de l'axe des catégories
+        filename (str): Nom du fichier image dans FIGURES_DIR
+        figsize (tuple): Taille de la figure en pouces
+    """
+    plt = get_pyplot()
+    
+    fig, ax = plt.subplots(figsize=figsize)
+    positions = range(len(counts))
+    ax.barh(positions, counts.to_numpy())
+    ax.set_yticks(positions, labels=counts.index.astype(str))
+    # La première catégorie (la plus fréquente) en haut du graphique
+    ax.invert_yaxis()
+    ax.set_title(title)
+    ax.set_xlabel('Nombre d\'offres')
+    ax.set_ylabel(ylabel)
+    fig.tight_layout()
+    
+    os.makedirs(FIGURES_DIR, exist_ok=True)
+    fig.savefig(os.path.join(FIGURES_DIR, filename), dpi=FIGURE_DPI)
+    plt.close(fig)
+
 def analyze_contract_types(df):
     """
     Analyse la distribution des types de contrat.
@@ -204,27 +407,19 @@ def analyze_contract_types(df):
     contract_counts = df['contract_type'].value_counts()
     
     # Calculer les pourcentages
-    contract_percentages = (contract_counts / len(df) * 100).round(2)
+    total = len(df)
+    contract_percentages = (contract_counts / total * 100).round(2)
     
     # Créer un dictionnaire de résultats
     results = {
         'counts': contract_counts.to_dict(),
         'percentages': contract_percentages.to_dict(),
-        'total': len(df)
+        'total': total
     }
     
-    # Créer un graphique
-    plt.figure(figsize=(10, 6))
-    sns.countplot(y='contract_type', data=df, order=contract_counts.index)
-    plt.title('Distribution des Types de Contrat')
-    plt.xlabel('Nombre d\'offres')
-    plt.ylabel('Type de Contrat')
-    plt.tight_layout()
-    
-    # Sauvegarder le graphique
-    os.makedirs('reports/figures', exist_ok=True)
-    plt.savefig('reports/figures/contract_types.png')
-    plt.close()
+    # Créer un graphique à partir des comptages déjà calculés
+    save_bar_chart(contract_counts, 'Distribution des Types de Contrat', 'Type de Contrat',
+                   'contract_types.png', figsize=(10, 6))
     
     return results
 
@@ -241,49 +436,32 @@ def analyze_skills(df):
     if df.empty or 'skills' not in df.columns:
         return {}
     
-    # Extraire toutes les compétences
-    all_skills = []
-    for skills_list in df['skills']:
-        if isinstance(skills_list, list):
-            all_skills.extend(skills_list)
+    from wordcloud import WordCloud
     
-    # Compter les occurrences
-    skill_counts = Counter(all_skills)
+    # Compter les occurrences de chaque compétence ; explode accepte aussi bien les listes
+    # (S3, fichiers locaux) que les tableaux relus depuis le cache Parquet
+    skill_counts = df['skills'].explode().dropna().value_counts()
     
     # Obtenir les 20 compétences les plus fréquentes
-    top_skills = dict(skill_counts.most_common(20))
+    top_skill_counts = skill_counts.head(20)
+    top_skills = top_skill_counts.to_dict()
     
     # Créer un dictionnaire de résultats
     results = {
         'top_skills': top_skills,
         'unique_skills': len(skill_counts),
-        'total_mentions': sum(skill_counts.values())
+        'total_mentions': int(skill_counts.sum())
     }
     
-    # Créer un graphique
-    plt.figure(figsize=(12, 8))
-    top_skills_df = pd.DataFrame(list(top_skills.items()), columns=['Skill', 'Count'])
-    sns.barplot(x='Count', y='Skill', data=top_skills_df.sort_values('Count', ascending=False))
-    plt.title('Top 20 des Compétences les Plus Demandées')
-    plt.xlabel('Nombre d\'offres')
-    plt.ylabel('Compétence')
-    plt.tight_layout()
-    
-    # Sauvegarder le graphique
-    os.makedirs('reports/figures', exist_ok=True)
-    plt.savefig('reports/figures/top_skills.png')
-    plt.close()
+    # Créer un graphique (value_counts renvoie déjà les compétences triées par fréquence)
+    save_bar_chart(top_skill_counts, 'Top 20 des Compétences les Plus Demandées', 'Compétence',
+                   'top_skills.png')
     
     # Créer un nuage de mots
-    wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(skill_counts)
-    plt.figure(figsize=(10, 5))
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-    plt.tight_layout()
+    wordcloud = WordCloud(width=800, height=400, background_color='white').generate_from_frequencies(skill_counts.to_dict())
     
-    # Sauvegarder le nuage de mots
-    plt.savefig('reports/figures/skills_wordcloud.png')
-    plt.close()
+    # Sauvegarder directement l'image du nuage de mots, sans passer par une figure matplotlib
+    wordcloud.to_file(os.path.join(FIGURES_DIR, 'skills_wordcloud.png'))
     
     return results
 
@@ -300,35 +478,27 @@ def analyze_locations(df):
     if df.empty or 'location' not in df.columns:
         return {}
     
-    # Nettoyer et standardiser les localisations
-    df['location_clean'] = df['location'].str.extract(r'([A-Za-zÀ-ÿ\-]+)')
+    # Nettoyer et standardiser les localisations (Series locale : le DataFrame reçu n'est pas modifié)
+    location_clean = df['location'].str.extract(r'([A-Za-zÀ-ÿ\-]+)', expand=False)
     
-    # Compter les localisations
-    location_counts = df['location_clean'].value_counts().head(15)
+    # Compter les localisations (un seul comptage sert au top 15 et au nombre de localisations)
+    all_location_counts = location_clean.value_counts()
+    location_counts = all_location_counts.head(15)
     
     # Calculer les pourcentages
-    location_percentages = (location_counts / len(df) * 100).round(2)
+    total = len(df)
+    location_percentages = (location_counts / total * 100).round(2)
     
     # Créer un dictionnaire de résultats
     results = {
         'top_locations': location_counts.to_dict(),
         'percentages': location_percentages.to_dict(),
-        'unique_locations': df['location_clean'].nunique(),
-        'total': len(df)
+        'unique_locations': len(all_location_counts),
+        'total': total
     }
     
-    # Créer un graphique
-    plt.figure(figsize=(12, 8))
-    sns.countplot(y='location_clean', data=df, order=location_counts.index)
-    plt.title('Top 15 des Localisations')
-    plt.xlabel('Nombre d\'offres')
-    plt.ylabel('Localisation')
-    plt.tight_layout()
-    
-    # Sauvegarder le graphique
-    os.makedirs('reports/figures', exist_ok=True)
-    plt.savefig('reports/figures/top_locations.png')
-    plt.close()
+    # Créer un graphique à partir des comptages déjà calculés
+    save_bar_chart(location_counts, 'Top 15 des Localisations', 'Localisation', 'top_locations.png')
     
     return results
 
@@ -345,39 +515,96 @@ def analyze_sources(df):
     if df.empty or 'source' not in df.columns:
         return {}
     
+    plt = get_pyplot()
+    
     # Compter les sources
     source_counts = df['source'].value_counts()
     
     # Calculer les pourcentages
-    source_percentages = (source_counts / len(df) * 100).round(2)
+    total = len(df)
+    source_percentages = (source_counts / total * 100).round(2)
     
     # Créer un dictionnaire de résultats
     results = {
         'counts': source_counts.to_dict(),
         'percentages': source_percentages.to_dict(),
-        'total': len(df)
+        'total': total
     }
     
     # Créer un graphique
-    plt.figure(figsize=(10, 6))
-    plt.pie(source_counts, labels=source_counts.index, autopct='%1.1f%%', startangle=90)
-    plt.axis('equal')
-    plt.title('Distribution des Sources d\'Offres')
-    plt.tight_layout()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.pie(source_counts, labels=source_counts.index, autopct='%1.1f%%', startangle=90)
+    ax.axis('equal')
+    ax.set_title('Distribution des Sources d\'Offres')
+    fig.tight_layout()
     
     # Sauvegarder le graphique
-    os.makedirs('reports/figures', exist_ok=True)
-    plt.savefig('reports/figures/sources_pie.png')
-    plt.close()
+    os.makedirs(FIGURES_DIR, exist_ok=True)
+    fig.savefig(os.path.join(FIGURES_DIR, 'sources_pie.png'), dpi=FIGURE_DPI)
+    plt.close(fig)
     
     return results
 
-def generate_report(df=None):
+def init_analysis_worker(log_queue):
+    """
+    Redirige les logs d'un processus d'analyse vers le processus principal.
+    
+    Un processus issu du fork hérite du QueueHandler du logger racine, dont la
+    file n'est lue par personne dans le processus fils : ses messages seraient perdus.
+    
+    Args:
+        log_queue (multiprocessing.Queue): File lue par le processus principal
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    # Les avertissements (matplotlib, wordcloud...) passent par la file plutôt que d'écrire sur stderr
+    logging.captureWarnings(True)
+
+def read_existing_report(data_version):
+    """
+    Relit le rapport précédent s'il a été produit à partir de la même version des données
+    et que ses graphiques sont toujours présents dans FIGURES_DIR.
+    
+    Args:
+        data_version (str): Version des données chargées
+    
+    Returns:
+        dict: Résultats du rapport précédent, ou None s'il est absent, périmé ou incomplet
+    """
+    if not os.path.exists(REPORT_FILE):
+        return None
+    
+    try:
+        with open(REPORT_FILE, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Impossible de relire le rapport {REPORT_FILE}: {e}")
+        return None
+    
+    if report.get('metadata', {}).get('data_version') != data_version:
+        return None
+    
+    # Les analyses sans résultat (colonne absente) n'ont pas produit de graphique
+    missing_figures = [
+        filename
+        for name, filenames in ANALYSIS_FIGURES.items() if report.get(name)
+        for filename in filenames if not os.path.exists(os.path.join(FIGURES_DIR, filename))
+    ]
+    if missing_figures:
+        logger.info(f"Graphiques manquants ({', '.join(missing_figures)}), régénération du rapport")
+        return None
+    return report
+
+def generate_report(df=None, force=False):
     """
     Génère un rapport complet d'analyse des offres d'emploi.
     
     Args:
         df (pandas.DataFrame, optional): DataFrame contenant les offres d'emploi
+        force (bool): Si True, recharge les offres depuis RDS sans utiliser le cache
+            et régénère le rapport même si les données n'ont pas changé
     
     Returns:
         dict: Résultats de l'analyse
@@ -385,7 +612,7 @@ def generate_report(df=None):
     # Charger les données si non fournies
     if df is None:
         # Essayer d'abord RDS
-        df = load_jobs_from_rds()
+        df = load_jobs_from_rds(force=force)
         
         # Si RDS échoue, essayer S3
         if df.empty:
@@ -399,34 +626,88 @@ def generate_report(df=None):
         logger.error("Impossible de charger les données d'offres d'emploi")
         return {}
     
+    # Données inchangées depuis le dernier rapport : inutile de refaire analyses et graphiques
+    data_version = df.attrs.get('data_version')
+    if data_version and not force:
+        report = read_existing_report(data_version)
+        if report is not None:
+            logger.info(f"Données inchangées, rapport existant conservé: {REPORT_FILE}")
+            return report
+    
+    # Les colonnes répétitives sont stockées sous forme de codes entiers :
+    # comptages plus rapides et DataFrame plus léger à transmettre aux processus d'analyse
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS if col in df.columns})
+    
     # Créer le répertoire de rapports
     os.makedirs('reports', exist_ok=True)
     
     # Effectuer les analyses
     logger.info("Génération du rapport d'analyse...")
     
+    # Les analyses sont indépendantes (chacune produit ses propres graphiques),
+    # on les exécute dans des processus séparés
+    analyses = {
+        'contract_types': analyze_contract_types,
+        'skills': analyze_skills,
+        'locations': analyze_locations,
+        'sources': analyze_sources
+    }
+    analysis_results = {}
+    failed_analyses = []
+    # Les messages des processus d'analyse sont réémis par les handlers du processus principal
+    log_queue = multiprocessing.Queue()
+    log_listener = QueueListener(log_queue, *logging.getLogger().handlers)
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=min(len(analyses), os.cpu_count() or 1),
+                                 initializer=init_analysis_worker, initargs=(log_queue,)) as executor:
+            futures = {name: executor.submit(func, df) for name, func in analyses.items()}
+            for name, future in futures.items():
+                try:
+                    analysis_results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Erreur lors de l'analyse '{name}': {e}")
+                    analysis_results[name] = {}
+                    failed_analyses.append(name)
+    finally:
+        log_listener.stop()
+    
+    # Bornes de la période couverte, calculées en un seul appel
+    if 'scraped_at' in df.columns:
+        date_range = df['scraped_at'].agg(['min', 'max']).to_dict()
+    else:
+        date_range = {'min': None, 'max': None}
+    
     results = {
         'metadata': {
             'total_jobs': len(df),
             'generated_at': datetime.now().isoformat(),
+            # Un rapport incomplet n'est pas associé aux données : il sera régénéré au prochain lancement
+            'data_version': None if failed_analyses else data_version,
             'sources': df['source'].unique().tolist() if 'source' in df.columns else [],
-            'date_range': {
-                'min': df['scraped_at'].min() if 'scraped_at' in df.columns else None,
-                'max': df['scraped_at'].max() if 'scraped_at' in df.columns else None
-            }
+            'date_range': date_range
         },
-        'contract_types': analyze_contract_types(df),
-        'skills': analyze_skills(df),
-        'locations': analyze_locations(df),
-        'sources': analyze_sources(df)
+        **analysis_results
     }
     
-    # Sauvegarder les résultats
-    with open('reports/job_analysis_report.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=4)
-    
-    logger.info("Rapport d'analyse généré avec succès: reports/job_analysis_report.json")
-    logger.info("Graphiques sauvegardés dans: reports/figures/")
+    # Sauvegarder les résultats dans un fichier temporaire renommé ensuite : un lecteur
+    # (ou la réutilisation du rapport au prochain lancement) ne voit jamais de fichier partiel
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(REPORT_FILE), suffix='.json.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            # default=str sérialise les dates (Timestamp) renvoyées par les agrégations
+            json.dump(results, f, ensure_ascii=False, indent=4, default=str)
+        # mkstemp crée le fichier en 0600 : rétablir les droits habituels (umask), comme pour les graphiques
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, REPORT_FILE)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    
+    logger.info(f"Rapport d'analyse généré avec succès: {REPORT_FILE}")
+    logger.info(f"Graphiques sauvegardés dans: {FIGURES_DIR}/")
     
     return results
 
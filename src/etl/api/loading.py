@@ -11,10 +11,16 @@ import sys
 import logging
 import pandas as pd
 from datetime import datetime
-from sqlalchemy import create_engine, Column, String, Integer, Float, Text, DateTime, MetaData, Table, inspect
+from sqlalchemy import Column, String, Integer, Float, Text, DateTime, MetaData, Table, inspect
 from sqlalchemy.exc import SQLAlchemyError
 import psycopg2
 
+# Ajouter le chemin du projet au PYTHONPATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Moteurs partagés avec les autres pipelines ETL
+from etl.db_config import get_shared_engine
+
 # Configuration du logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,27 +36,27 @@ def get_db_connection():
     """
     Établit une connexion à la base de données PostgreSQL.
     
+    Le moteur et son pool de connexions sont créés une seule fois puis
+    réutilisés par les appels suivants.
+    
     Returns:
         sqlalchemy.engine.base.Engine: Moteur de connexion SQLAlchemy
     """
     try:
         # Récupérer les paramètres de connexion depuis les variables d'environnement
-        host = os.getenv('DB_HOST')
-        port = os.getenv('DB_PORT')
-        database = os.getenv('DB_NAME')
-        user = os.getenv('DB_USER')
-        password = os.getenv('DB_PASSWORD')
+        env = os.environ
+        host = env.get('DB_HOST')
+        port = env.get('DB_PORT')
+        database = env.get('DB_NAME')
+        user = env.get('DB_USER')
+        password = env.get('DB_PASSWORD')
 
         # Créer l'URL de connexion
         conn_str = f"postgresql://{user}:{password}@{host}:{port}/{database}"
         
-        # Créer le moteur avec un timeout augmenté pour tenir compte des latences réseau
-        engine = create_engine(conn_str, connect_args={'connect_timeout': 30})
-        
-        # Tester la connexion
-        with engine.connect() as connection:
-            logger.info(f"Connexion établie avec succès à la base de données {database} sur {host}")
-            
+        # Créer (ou réutiliser) le moteur avec un timeout augmenté pour tenir compte des latences réseau
+        engine = get_shared_engine(conn_str, {'connect_timeout': 30})
+        logger.info(f"Connexion établie avec succès à la base de données {database} sur {host}")
         return engine
     except SQLAlchemyError as e:
         logger.error(f"Erreur de connexion à la base de données: {e}")
@@ -170,14 +176,13 @@ def prepare_job_data_for_loading(df):
         logger.error("Aucune colonne requise trouvée dans le DataFrame")
         return None
     
-    # Sélectionner et renommer les colonnes
-    result_df = df[columns_to_keep].copy()
-    result_df.columns = [column_mapping[col] for col in columns_to_keep]
-    
-    # Ajouter les colonnes manquantes avec des valeurs NULL
-    for target_col in column_mapping.values():
-        if target_col not in result_df.columns:
-            result_df[target_col] = None
+    # Sélectionner et renommer les colonnes, puis ajouter en une seule opération
+    # les colonnes manquantes (valeurs NULL) dans l'ordre de la table
+    result_df = (
+        df[columns_to_keep]
+        .rename(columns=column_mapping)
+        .reindex(columns=list(column_mapping.values()))
+    )
     
     # Ajouter la source
     result_df['source'] = 'FRANCE_TRAVAIL'
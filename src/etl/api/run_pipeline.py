@@ -73,24 +73,13 @@ def check_prerequisites():
     # Vérifier les variables d'environnement AWS si on doit se connecter à la base de données
     if not args.skip_db:
         aws_vars = ['DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD']
-        missing_vars = [var for var in aws_vars if not os.getenv(var)]
+        env = os.environ
+        missing_vars = [var for var in aws_vars if not env.get(var)]
         
-        # Si les variables ne sont pas définies, utiliser les valeurs par défaut
+        # Aucune valeur par défaut n'existe pour ces paramètres : le chargement
+        # échouera à la connexion, mais l'extraction et la transformation restent possibles
         if missing_vars:
             logger.warning(f"Variables d'environnement manquantes: {missing_vars}")
-            logger.info("Utilisation des valeurs par défaut pour la connexion à la base de données")
-            
-            # Définir les valeurs par défaut
-            if not os.getenv('DB_HOST'):
-                os.environ['DB_HOST'] = os.getenv('DB_HOST')
-            if not os.getenv('DB_PORT'):
-                os.environ['DB_PORT'] = os.getenv('DB_PORT')
-            if not os.getenv('DB_NAME'):
-                os.environ['DB_NAME'] = os.getenv('DB_NAME')
-            if not os.getenv('DB_USER'):
-                os.environ['DB_USER'] = os.getenv('DB_USER')
-            if not os.getenv('DB_PASSWORD'):
-                os.environ['DB_PASSWORD'] = os.getenv('DB_PASSWORD')
     
     return True
 
@@ -23,6 +23,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Montant suivi d'un symbole ou du mot euro(s), tel que recherché par extract_salary_info
+SALARY_AMOUNT_PATTERN = r'(\d+[\s\d]*[\d,.]*)(?:\s*[€$£]|\s*euros?|\s*euro)'
+
+# Chaîne de chiffres convertible par float() (au plus un séparateur décimal)
+SALARY_NUMBER_RE = re.compile(r'\d+\.?\d*|\.\d+')
+
 def clean_text_field(text):
     """
     Nettoie un champ texte en supprimant les caractères HTML et en normalisant l'espacement.
@@ -45,6 +51,47 @@ def clean_text_field(text):
     # Supprimer les espaces en début et fin
     return text.strip()
 
+def clean_text_series(series):
+    """
+    Applique clean_text_field à une colonne entière en une seule passe vectorisée.
+    
+    Seules les valeurs textuelles sont nettoyées, les autres sont conservées telles quelles.
+    
+    Args:
+        series (pandas.Series): Colonne à nettoyer
+        
+    Returns:
+        pandas.Series: Colonne nettoyée
+    """
+    is_text = series.map(type).eq(str)
+    if not is_text.any():
+        return series.copy()
+    
+    cleaned = (
+        series[is_text]
+        .str.replace(r'<.*?>', ' ', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+    )
+    result = series.astype(object)
+    result[is_text] = cleaned
+    return result
+
+def parse_salary_amount(amount_text):
+    """
+    Convertit un montant extrait du texte de salaire en nombre.
+    
+    Args:
+        amount_text (str): Montant tel que capturé par SALARY_AMOUNT_PATTERN
+        
+    Returns:
+        float: Montant, ou None s'il ne forme pas un nombre valide
+    """
+    digits = re.sub(r'[^\d.]', '', amount_text.replace(',', '.'))
+    if not SALARY_NUMBER_RE.fullmatch(digits):
+        return None
+    return float(digits)
+
 def extract_salary_info(salary_text):
     """
     Extrait les informations de salaire à partir du texte.
@@ -65,7 +112,7 @@ def extract_salary_info(salary_text):
     currency = "EUR"
     
     # Rechercher les montants
-    amounts = re.findall(r'(\d+[\s\d]*[\d,.]*)(?:\s*[€$£]|\s*euros?|\s*euro)', salary_text.lower())
+    amounts = re.findall(SALARY_AMOUNT_PATTERN, salary_text.lower())
     
     # Déterminer la périodicité
     if "annuel" in salary_text.lower() or "par an" in salary_text.lower():
@@ -83,21 +130,82 @@ def extract_salary_info(salary_text):
     elif "$" in salary_text:
         currency = "USD"
     
-    # Extraire min et max
-    if len(amounts) >= 2:
-        try:
-            min_salary = float(re.sub(r'[^\d.]', '', amounts[0].replace(',', '.')))
-            max_salary = float(re.sub(r'[^\d.]', '', amounts[1].replace(',', '.')))
-        except ValueError:
-            pass
-    elif len(amounts) == 1:
-        try:
-            min_salary = float(re.sub(r'[^\d.]', '', amounts[0].replace(',', '.')))
-        except ValueError:
-            pass
+    # Extraire min et max (le maximum n'est retenu que si le minimum est valide)
+    if amounts:
+        min_salary = parse_salary_amount(amounts[0])
+        if min_salary is not None and len(amounts) >= 2:
+            max_salary = parse_salary_amount(amounts[1])
     
     return min_salary, max_salary, periodicity, currency
 
+def extract_salary_columns(salary_series):
+    """
+    Version vectorisée de extract_salary_info appliquée à une colonne entière.
+    
+    Args:
+        salary_series (pandas.Series): Colonne contenant les textes de salaire
+        
+    Returns:
+        pandas.DataFrame: Colonnes min_salary, max_salary, salary_periodicity et currency,
+        alignées sur les positions de salary_series
+    """
+    # Index positionnel : extractall indexe ses résultats par ligne d'origine
+    texts = salary_series.reset_index(drop=True).astype(object)
+    # Masque construit sans l'accesseur .str, qui échoue sur une colonne sans aucune chaîne
+    is_text = texts.map(lambda value: isinstance(value, str) and value != '').astype(bool)
+    
+    # Aucun salaire renseigné (cas fréquent) : inutile de lancer les recherches d'expressions
+    if not is_text.any():
+        return pd.DataFrame({
+            'min_salary': np.full(len(texts), np.nan),
+            'max_salary': np.full(len(texts), np.nan),
+            'salary_periodicity': np.full(len(texts), None, dtype=object),
+            'currency': np.full(len(texts), 'EUR', dtype=object),
+        })
+    
+    texts = texts.where(is_text)
+    lowered = texts.str.lower()
+    
+    # Deux premiers montants trouvés dans chaque texte, convertis comme dans extract_salary_info
+    amounts = lowered.str.extractall(SALARY_AMOUNT_PATTERN)[0]
+    amounts = pd.to_numeric(
+        amounts.str.replace(',', '.', regex=False).str.replace(r'[^\d.]', '', regex=True),
+        errors='coerce'
+    )
+    match_position = amounts.index.get_level_values('match')
+    min_salary = amounts[match_position == 0].droplevel('match').reindex(texts.index)
+    max_salary = amounts[match_position == 1].droplevel('match').reindex(texts.index)
+    # Le maximum n'est retenu que si le minimum a pu être converti
+    max_salary = max_salary.where(min_salary.notna())
+    
+    # Déterminer la périodicité (mensuelle par défaut)
+    periodicity = np.select(
+        [
+            lowered.str.contains('annuel|par an', na=False),
+            lowered.str.contains('mensuel|par mois', na=False),
+            lowered.str.contains("horaire|de l'heure", na=False),
+        ],
+        ['yearly', 'monthly', 'hourly'],
+        default='monthly'
+    )
+    
+    # Détecter la devise
+    currency = np.select(
+        [
+            texts.str.contains('£', regex=False, na=False),
+            texts.str.contains('$', regex=False, na=False),
+        ],
+        ['GBP', 'USD'],
+        default='EUR'
+    )
+    
+    return pd.DataFrame({
+        'min_salary': min_salary.to_numpy(),
+        'max_salary': max_salary.to_numpy(),
+        'salary_periodicity': np.where(is_text, periodicity, None),
+        'currency': currency,
+    })
+
 def categorize_contract_type(contract_text):
     """
     Catégorise le type de contrat selon une nomenclature standard.
@@ -174,8 +282,9 @@ def transform_job_dataframe(df):
     
     logger.info("Début des transformations sur les données")
     
-    # Créer une copie pour éviter de modifier l'original
-    result_df = df.copy()
+    # Copie superficielle : seules des colonnes sont ajoutées, les données
+    # existantes ne sont jamais modifiées et n'ont donc pas besoin d'être dupliquées
+    result_df = df.copy(deep=False)
     
     # Gérer les valeurs manquantes dans les colonnes principales
     required_columns = ['id', 'intitule', 'description', 'dateCreation']
@@ -188,21 +297,23 @@ def transform_job_dataframe(df):
     text_columns = ['intitule', 'description', 'lieuTravail', 'entreprise']
     for col in text_columns:
         if col in result_df.columns:
-            result_df[col + '_clean'] = result_df[col].apply(
-                lambda x: clean_text_field(x) if isinstance(x, str) else x
-            )
+            result_df[col + '_clean'] = clean_text_series(result_df[col])
     
     # Extraire les informations sur le salaire
     if 'salaire' in result_df.columns:
-        salary_info = result_df['salaire'].apply(extract_salary_info)
-        result_df['min_salary'] = [info[0] for info in salary_info]
-        result_df['max_salary'] = [info[1] for info in salary_info]
-        result_df['salary_periodicity'] = [info[2] for info in salary_info]
-        result_df['currency'] = [info[3] for info in salary_info]
+        salary_columns = extract_salary_columns(result_df['salaire'])
+        # Conservés en float64 : les montants sont écrits tels quels dans des colonnes double précision
+        result_df['min_salary'] = salary_columns['min_salary'].astype('float64').to_numpy()
+        result_df['max_salary'] = salary_columns['max_salary'].astype('float64').to_numpy()
+        result_df['salary_periodicity'] = salary_columns['salary_periodicity'].to_numpy()
+        result_df['currency'] = salary_columns['currency'].to_numpy()
     
     # Standardiser le type de contrat
     if 'typeContrat' in result_df.columns:
-        result_df['contract_type_std'] = result_df['typeContrat'].apply(categorize_contract_type)
+        # Peu de libellés distincts : chacun n'est catégorisé qu'une fois, puis reporté sur les offres
+        contract_types = result_df['typeContrat']
+        contract_mapping = {value: categorize_contract_type(value) for value in contract_types.dropna().unique()}
+        result_df['contract_type_std'] = contract_types.map(contract_mapping).fillna("UNKNOWN")
     
     # Extraire le niveau d'expérience à partir de la description
     if 'description' in result_df.columns:
@@ -279,16 +390,35 @@ def apply_keyword_analysis(df):
     logger.info("Application de l'analyse par mots-clés aux offres d'emploi")
     
     # Extraire les mots-clés des descriptions
-    df['extracted_keywords'] = df['description_clean'].apply(extract_keywords)
+    extracted_keywords = df['description_clean'].apply(extract_keywords)
     
-    # Ajouter des colonnes booléennes pour les technologies principales
+    # Colonnes booléennes pour les technologies principales
+    # (0/1 stockés sur un octet, compatibles avec les colonnes Integer de la table).
+    # Un seul parcours des mots-clés calcule un masque de bits par offre,
+    # dont chaque colonne est ensuite extraite de façon vectorisée.
     main_techs = ["python", "java", "javascript", "sql", "aws", "machine learning"]
-    for tech in main_techs:
-        df[f'has_{tech.replace(" ", "_")}'] = df['extracted_keywords'].apply(
-            lambda x: 1 if tech in x else 0)
+    tech_bits = {tech: 1 << position for position, tech in enumerate(main_techs)}
+    tech_mask = extracted_keywords.apply(
+        lambda keywords: sum(tech_bits[kw] for kw in keywords if kw in tech_bits)
+    ).to_numpy(dtype=np.uint8)
+    keyword_columns = pd.DataFrame(
+        {
+            f'has_{tech.replace(" ", "_")}': ((tech_mask & bit) != 0).astype(np.int8)
+            for tech, bit in tech_bits.items()
+        },
+        index=df.index
+    )
+    keyword_columns.insert(0, 'extracted_keywords', extracted_keywords)
     
     # Compter le nombre de mots-clés trouvés
-    df['keyword_count'] = df['extracted_keywords'].apply(len)
+    keyword_columns['keyword_count'] = pd.to_numeric(extracted_keywords.str.len(), downcast='integer')
+    
+    # Ajout de toutes les colonnes en une seule opération, sans recopier les colonnes existantes
+    # (celles d'une analyse précédente sont remplacées)
+    previous_columns = df.columns.intersection(keyword_columns.columns)
+    if len(previous_columns) > 0:
+        df = df.drop(columns=previous_columns)
+    df = pd.concat([df, keyword_columns], axis=1, copy=False)
     
     logger.info("Analyse par mots-clés terminée")
     return df
@@ -7,9 +7,11 @@ Gère la connexion à PostgreSQL sur AWS RDS.
 """
 
 import os
+import atexit
 import logging
 import socket
 import time
+import threading
 from sqlalchemy import create_engine, exc
 from dotenv import load_dotenv
 
@@ -27,6 +29,61 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD')
 }
 
+# Moteurs partagés, indexés par URL et options de connexion (créés à la première connexion)
+DB_ENGINES = {}
+DB_ENGINES_LOCK = threading.Lock()
+
+def get_shared_engine(conn_str, connect_args):
+    """
+    Retourne le moteur SQLAlchemy partagé pour ces paramètres de connexion.
+    
+    Au premier appel, le moteur est créé et sa connexion testée ; il est ensuite
+    réutilisé avec son pool. Le verrou évite que deux pipelines se connectant
+    en même temps depuis des threads différents créent chacun un pool.
+    
+    Args:
+        conn_str (str): URL de connexion SQLAlchemy
+        connect_args (dict): Options transmises au pilote PostgreSQL
+        
+    Returns:
+        sqlalchemy.engine.base.Engine: Moteur de connexion SQLAlchemy
+        
+    Raises:
+        sqlalchemy.exc.SQLAlchemyError: Si la connexion de test échoue (rien n'est alors conservé)
+    """
+    key = (conn_str, tuple(sorted(connect_args.items())))
+    with DB_ENGINES_LOCK:
+        engine = DB_ENGINES.get(key)
+        if engine is None:
+            engine = create_engine(
+                conn_str,
+                pool_size=4,
+                max_overflow=0,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                connect_args=connect_args
+            )
+            try:
+                # Tester la connexion (elle est ensuite conservée dans le pool)
+                with engine.connect():
+                    pass
+            except exc.SQLAlchemyError:
+                engine.dispose()
+                raise
+            DB_ENGINES[key] = engine
+        return engine
+
+def dispose_db_engines():
+    """
+    Ferme les connexions des pools de tous les moteurs partagés.
+    """
+    with DB_ENGINES_LOCK:
+        for engine in DB_ENGINES.values():
+            engine.dispose()
+        DB_ENGINES.clear()
+
+atexit.register(dispose_db_engines)
+
 def is_rds_accessible(host, port, timeout=5):
     """
     Vérifie si le serveur RDS est accessible.
@@ -54,6 +111,9 @@ def get_db_engine(max_retries=3, retry_interval=5):
     Crée et retourne un moteur de connexion SQLAlchemy pour PostgreSQL.
     Inclut une logique de retry et des diagnostics améliorés.
     
+    Le moteur et son pool de connexions sont créés une seule fois puis
+    réutilisés par les appels suivants.
+    
     Args:
         max_retries (int): Nombre maximum de tentatives de connexion
         retry_interval (int): Intervalle entre les tentatives en secondes
@@ -74,15 +134,6 @@ def get_db_engine(max_retries=3, retry_interval=5):
         logger.error(f"Paramètres de connexion manquants: {', '.join(missing_params)}")
         return None
     
-    # Vérifier si le serveur est accessible
-    if not is_rds_accessible(host, port):
-        logger.error(f"Le serveur RDS à l'adresse {host}:{port} n'est pas accessible")
-        logger.warning("Vérifiez que:")
-        logger.warning("1. L'instance RDS est démarrée")
-        logger.warning("2. Le groupe de sécurité autorise les connexions de votre adresse IP actuelle")
-        logger.warning("3. L'instance est configurée pour permettre les connexions publiques")
-        return None
-    
     # URL de connexion
     conn_str = f"postgresql://{user}:{password}@{host}:{port}/{database}"
     
@@ -91,22 +142,27 @@ def get_db_engine(max_retries=3, retry_interval=5):
         try:
             logger.info(f"Tentative de connexion à la base de données ({attempt}/{max_retries})...")
             
-            # Créer le moteur avec un timeout augmenté
-            engine = create_engine(
-                conn_str, 
-                connect_args={
-                    'connect_timeout': 10,
-                    'application_name': 'ETL_Pipeline'
-                }
-            )
-            
-            # Tester la connexion
-            with engine.connect() as connection:
-                logger.info(f"Connexion établie avec succès à {database} sur {host}")
-                return engine
+            # Créer (ou réutiliser) le moteur avec un timeout augmenté
+            engine = get_shared_engine(conn_str, {
+                'connect_timeout': 10,
+                'application_name': 'ETL_Pipeline'
+            })
+            logger.info(f"Connexion établie avec succès à {database} sur {host}")
+            return engine
                 
         except exc.SQLAlchemyError as e:
             logger.error(f"Tentative {attempt} échouée: {str(e)}")
+            
+            # Diagnostic réseau uniquement en cas d'échec : inutile de réessayer
+            # si le serveur n'est pas joignable
+            if attempt == 1 and not is_rds_accessible(host, port):
+                logger.error(f"Le serveur RDS à l'adresse {host}:{port} n'est pas accessible")
+                logger.warning("Vérifiez que:")
+                logger.warning("1. L'instance RDS est démarrée")
+                logger.warning("2. Le groupe de sécurité autorise les connexions de votre adresse IP actuelle")
+                logger.warning("3. L'instance est configurée pour permettre les connexions publiques")
+                return None
+            
             if attempt < max_retries:
                 logger.info(f"Nouvelle tentative dans {retry_interval} secondes...")
                 time.sleep(retry_interval)
@@ -11,6 +11,7 @@ import os
 import sys
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Configurer le logging
@@ -124,23 +125,26 @@ def run_full_etl_pipeline(sources, start_date=None, end_date=None):
     if not test_database_connection():
         logger.warning("Le pipeline continuera mais le chargement risque d'échouer")
     
-    results = {}
-    
-    # Traiter France Travail
+    # Les pipelines des deux sources sont indépendants (extraction réseau, tables distinctes) :
+    # ils sont exécutés en parallèle
+    pipelines = {}
     if 'all' in sources or 'france_travail' in sources:
-        try:
-            results['france_travail'] = run_france_travail_pipeline(start_date, end_date)
-        except Exception as e:
-            logger.error(f"Erreur dans le pipeline France Travail: {e}")
-            results['france_travail'] = 0
-    
-    # Traiter Welcome to the Jungle
+        pipelines['france_travail'] = ('France Travail', run_france_travail_pipeline, (start_date, end_date))
     if 'all' in sources or 'welcome_jungle' in sources:
-        try:
-            results['welcome_jungle'] = run_welcome_jungle_pipeline()
-        except Exception as e:
-            logger.error(f"Erreur dans le pipeline Welcome to the Jungle: {e}")
-            results['welcome_jungle'] = 0
+        pipelines['welcome_jungle'] = ('Welcome to the Jungle', run_welcome_jungle_pipeline, ())
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(len(pipelines), 1)) as executor:
+        futures = {
+            source: executor.submit(func, *func_args)
+            for source, (_, func, func_args) in pipelines.items()
+        }
+        for source, future in futures.items():
+            try:
+                results[source] = future.result()
+            except Exception as e:
+                logger.error(f"Erreur dans le pipeline {pipelines[source][0]}: {e}")
+                results[source] = 0
     
     # Afficher un résumé des résultats
     logger.info("=== Résumé du pipeline ETL ===")
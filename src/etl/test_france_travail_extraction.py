@@ -170,17 +170,18 @@ def analyze_job_data(df):
     # 2. Types de contrats
     if 'typeContratLibelle' in df.columns:
         contrats = df['typeContratLibelle'].value_counts()
-        logger.info("\nTypes de contrats:")
-        for contrat, count in contrats.head(10).items():
-            logger.info(f"  - {contrat}: {count} offres")
+        logger.info("\nTypes de contrats:\n" + "\n".join(
+            f"  - {contrat}: {count} offres" for contrat, count in contrats.head(10).items()
+        ))
     
     # 3. Répartition géographique
     if 'lieuTravail' in df.columns and isinstance(df['lieuTravail'].iloc[0], dict):
-        lieux = df['lieuTravail'].apply(lambda x: x.get('libelle', 'Non spécifié') if isinstance(x, dict) else 'Non spécifié')
+        # str.get lit la clé dans chaque dictionnaire en une seule passe (NaN si absente)
+        lieux = df['lieuTravail'].str.get('libelle').fillna('Non spécifié')
         top_lieux = lieux.value_counts()
-        logger.info("\nTop 10 des lieux de travail:")
-        for lieu, count in top_lieux.head(10).items():
-            logger.info(f"  - {lieu}: {count} offres")
+        logger.info("\nTop 10 des lieux de travail:\n" + "\n".join(
+            f"  - {lieu}: {count} offres" for lieu, count in top_lieux.head(10).items()
+        ))
     
     # 4. Analyse des compétences les plus demandées
     if 'competences' in df.columns:
@@ -195,9 +196,9 @@ def analyze_job_data(df):
         if all_competences:
             from collections import Counter
             comp_counter = Counter(all_competences)
-            logger.info("\nTop 10 des compétences demandées:")
-            for comp, count in comp_counter.most_common(10):
-                logger.info(f"  - {comp}: {count} mentions")
+            logger.info("\nTop 10 des compétences demandées:\n" + "\n".join(
+                f"  - {comp}: {count} mentions" for comp, count in comp_counter.most_common(10)
+            ))
     
     # 5. Exemple détaillé d'une offre
     logger.info("\nExemple détaillé d'une offre:")
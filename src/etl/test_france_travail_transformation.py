@@ -30,7 +30,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Importer les modules nécessaires
 from etl.api.extraction import extract_by_date_range
 from etl.api.dotenv_utils import load_dotenv
-from etl.api.transformation import transform_job_dataframe, apply_keyword_analysis
+from etl.api.transformation import transform_job_dataframe, apply_keyword_analysis, extract_salary_columns, extract_salary_info
 
 def format_text_for_console(text, max_length=100):
     """Formate un texte pour l'affichage console en limitant sa longueur"""
@@ -117,24 +117,27 @@ def test_transformation_with_sample():
         
         # Statistiques sur les données transformées
         logger.info("=== Statistiques sur les données transformées ===")
-        logger.info(f"Nombre total d'offres transformées: {len(transformed_df)}")
+        total_jobs = len(transformed_df)
+        logger.info(f"Nombre total d'offres transformées: {total_jobs}")
         
         # Types de contrat standardisés
         contract_stats = transformed_df['contract_type_std'].value_counts()
-        logger.info("Répartition des types de contrat standardisés:")
-        for contract, count in contract_stats.items():
-            logger.info(f"  - {contract}: {count} offres ({count/len(transformed_df)*100:.1f}%)")
+        logger.info("Répartition des types de contrat standardisés:\n" + "\n".join(
+            f"  - {contract}: {count} offres ({count/total_jobs*100:.1f}%)"
+            for contract, count in contract_stats.items()
+        ))
         
         # Niveaux d'expérience
         if 'experience_level' in transformed_df.columns:
             exp_stats = transformed_df['experience_level'].value_counts()
-            logger.info("Répartition des niveaux d'expérience:")
-            for exp, count in exp_stats.items():
-                logger.info(f"  - {exp}: {count} offres ({count/len(transformed_df)*100:.1f}%)")
+            logger.info("Répartition des niveaux d'expérience:\n" + "\n".join(
+                f"  - {exp}: {count} offres ({count/total_jobs*100:.1f}%)"
+                for exp, count in exp_stats.items()
+            ))
         
         # Statistiques salariales
         salary_provided = transformed_df['min_salary'].notna().sum()
-        logger.info(f"Offres avec information salariale: {salary_provided} ({salary_provided/len(transformed_df)*100:.1f}%)")
+        logger.info(f"Offres avec information salariale: {salary_provided} ({salary_provided/total_jobs*100:.1f}%)")
         
         if salary_provided > 0:
             mean_min_salary = transformed_df['min_salary'].mean()
@@ -144,15 +147,15 @@ def test_transformation_with_sample():
         
         # Compétences techniques
         tech_columns = [col for col in transformed_df.columns if col.startswith('has_')]
-        logger.info("Répartition des compétences techniques:")
-        for col in tech_columns:
-            tech_name = col.replace('has_', '')
-            count = transformed_df[col].sum()
-            logger.info(f"  - {tech_name}: {count} offres ({count/len(transformed_df)*100:.1f}%)")
+        tech_counts = transformed_df[tech_columns].sum()
+        logger.info("Répartition des compétences techniques:\n" + "\n".join(
+            f"  - {col.replace('has_', '')}: {count} offres ({count/total_jobs*100:.1f}%)"
+            for col, count in tech_counts.items()
+        ))
         
         # Examiner quelques exemples transformés
         logger.info("=== Exemples d'offres transformées ===")
-        for i, (_, row) in enumerate(transformed_df.head(3).iterrows()):
+        for i, row in enumerate(transformed_df.head(3).to_dict('records')):
             logger.info(f"Offre #{i+1}:")
             logger.info(f"  - ID: {row.get('id', 'N/A')}")
             logger.info(f"  - Titre: {row.get('intitule', 'N/A')}")
@@ -176,6 +179,33 @@ def test_transformation_with_sample():
         logger.error(traceback.format_exc())
         return False
 
+def test_salary_extraction_without_text():
+    """
+    Vérifie que l'extraction vectorisée des salaires accepte des colonnes sans texte
+    (valeurs numériques, booléennes ou manquantes) comme extract_salary_info.
+    """
+    logger.info("=== Test d'extraction des salaires sans texte ===")
+    
+    samples = [[None, 3], [35000.0, float('nan')], [True, False], ["Mensuel de 2000 Euros", 1800]]
+    for values in samples:
+        try:
+            salary_columns = extract_salary_columns(pd.Series(values))
+        except Exception as e:
+            logger.error(f"Erreur lors de l'extraction des salaires {values}: {e}")
+            return False
+        
+        expected = [extract_salary_info(value) for value in values]
+        extracted = [
+            tuple(None if pd.isna(item) else item for item in row)
+            for row in salary_columns[['min_salary', 'max_salary', 'salary_periodicity', 'currency']].itertuples(index=False)
+        ]
+        if extracted != expected:
+            logger.error(f"Salaires extraits {extracted} différents de {expected} pour {values}")
+            return False
+    
+    logger.info("[SUCCÈS] Extraction des salaires sans texte réalisée avec succès")
+    return True
+
 def main():
     """Fonction principale du script de test"""
     logger.info("=== DÉBUT DES TESTS DE TRANSFORMATION FRANCE TRAVAIL ===")
@@ -184,7 +214,8 @@ def main():
     load_dotenv()
     
     # Tester la transformation
-    success = test_transformation_with_sample()
+    success = test_salary_extraction_without_text()
+    success = test_transformation_with_sample() and success
     
     if success:
         logger.info("[SUCCÈS] Tous les tests de transformation ont réussi!")
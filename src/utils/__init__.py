@@ -1,3 +1,3 @@
 
-from .logger import get_logger
+from .logger import get_logger, configure_logging
 from .config import DB_PATH, SCHEMA_PATH, NOBEL_API_URL, LOG_LEVEL
\ No newline at end of file
@@ -1,7 +1,15 @@
 # utils/logger.py
+import os
+import queue
+import atexit
 import logging
+from datetime import datetime
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from src.utils.config import LOG_LEVEL
 
+# Indique si la configuration du logger racine a déjà été faite dans ce processus
+_configured = False
+
 def get_logger(name: str) -> logging.Logger:
     """
     Crée et retourne un logger configuré avec le niveau de log défini dans config.py.
@@ -27,3 +35,45 @@ def get_logger(name: str) -> logging.Logger:
         logger.addHandler(console_handler)
     
     return logger
+
+def configure_logging(basename: str) -> None:
+    """
+    Configure une seule fois le logger racine (fichier logs/<basename>_<horodatage>.log et console).
+    
+    Les appels au logger se contentent d'empiler les messages dans une file ;
+    le formatage et les écritures sont faits par un thread dédié. Les écritures
+    dans le fichier sont regroupées par lots (vidage immédiat sur ERROR) ;
+    PIPELINE_LOG_UNBUFFERED=1 désactive ce tampon pour le débogage.
+    
+    :param basename: Préfixe du fichier de log.
+    """
+    global _configured
+    if _configured:
+        return
+    
+    os.makedirs('logs', exist_ok=True)
+    log_file = f"logs/{basename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    if os.getenv('PIPELINE_LOG_UNBUFFERED') == '1':
+        file_target = file_handler
+    else:
+        file_target = MemoryHandler(capacity=1024, flushLevel=logging.ERROR,
+                                    target=file_handler, flushOnClose=True)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_target, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Le QueueHandler ne garde que le message, le format complet est appliqué par le listener
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
+        format='%(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+    _configured = True